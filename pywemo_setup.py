@@ -24,41 +24,86 @@ information.
 # -----------------------------------------------------------------------------
 # ---[ Imports ]---------------------------------------------------------------
 # -----------------------------------------------------------------------------
+from __future__ import annotations
+
 import csv
+import json
+import itertools
 import time
+import atexit
 import shutil
+import functools
 import pathlib
 import logging
 import datetime
 import platform
 import subprocess
 from getpass import getpass
-from typing import List, Tuple
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from logging.handlers import MemoryHandler
 
 import click
 import colorlog
 
-import pywemo
-from pywemo.ouimeaux_device import Device, SetupException, ResetException
+# pywemo (and its dependencies) are slow to import, so it is only imported
+# within the functions that use it, keeping the cli (e.g. --help) responsive
+if TYPE_CHECKING:
+    from pywemo.ouimeaux_device import Device
+    from pywemo.ouimeaux_device.api.service import Action
 
 
 # -----------------------------------------------------------------------------
 LOG = colorlog.getLogger()
 LOG.addHandler(logging.NullHandler())
 
-DASHES = '-' * (shutil.get_terminal_size().columns - 11)
+# devices found by a previous discovery, probed directly before falling back
+# to a (slow) full discovery when looking for a device by name
+DEVICE_CACHE = pathlib.Path('~/.cache/pywemo_setup.json').expanduser()
 
 # context for -h/--help usage with click
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
 
+# -----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def dashes() -> str:
+    """Separator line sized to the terminal (computed once, when needed)."""
+    return '-' * max(0, shutil.get_terminal_size().columns - 11)
+
+
+# -----------------------------------------------------------------------------
+class LevelColoredFormatter(colorlog.ColoredFormatter):
+    """Colored formatter for the fixed "[level] message" log format.
+
+    The colored level prefix is built once per level, rather than for every
+    record as is done by colorlog.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the formatter."""
+        super().__init__('%(log_color)s[%(levelname)-8s] %(message)s')
+        self.prefixes = {}
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format the message (exception and stack info are added later)."""
+        try:
+            prefix, suffix = self.prefixes[record.levelname]
+        except KeyError:
+            # the escape codes are all blank if color is disabled (NO_COLOR)
+            escapes = self._escape_code_map(record.levelname)
+            prefix = f'{escapes["log_color"]}[{record.levelname:<8}] '
+            suffix = escapes['reset'] if self.reset else ''
+            self.prefixes[record.levelname] = prefix, suffix
+        return f'{prefix}{record.message}{suffix}'
+
+
 # -----------------------------------------------------------------------------
 def setup_logger(verbose: int) -> None:
     """Logger setup."""
     handler = colorlog.StreamHandler()
-    formatter = colorlog.ColoredFormatter(
-        '%(log_color)s[%(levelname)-8s] %(message)s'
-    )
+    formatter = LevelColoredFormatter()
     handler.setFormatter(formatter)
     LOG.addHandler(handler)
     if verbose == 0:
@@ -72,67 +117,103 @@ def setup_logger(verbose: int) -> None:
         # include all debug messages
         LOG.setLevel(logging.DEBUG)
     else:
-        # include all debug messages and also write the log to file
+        # include all debug messages and also write the log to file, the file
+        # writes are buffered in memory and flushed in bulk (or immediately
+        # on an error) since this level is very talkative
         filename = pathlib.Path('wemo_reset_setup.log')
         LOG.setLevel(logging.DEBUG)
-        handler = logging.FileHandler(filename, mode='w')
+        file_handler = logging.FileHandler(filename, mode='w')
         formatter = logging.Formatter('[%(levelname)-8s] %(message)s')
-        handler.setFormatter(formatter)
+        file_handler.setFormatter(formatter)
+        handler = MemoryHandler(
+            capacity=1000,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
         LOG.addHandler(handler)
+        atexit.register(handler.close)
 
-    # Record some system and program information
-    date_time = datetime.datetime.now().astimezone()
-    date_time = date_time.strftime('%B %d, %Y, %I:%M %p (%Z)')
-    platinfo = ', '.join(platform.uname())
-    LOG.debug('logging started:  %s', date_time)
-    # pywemo does not provide version at this time (no pywemo.__version__)
-    LOG.debug('platform:  %s', platinfo)
-    LOG.debug('current directory:  %s', pathlib.Path.cwd())
-    if verbose > 2:
-        LOG.debug('logging to file:  %s', filename.resolve())
+    # Record some system and program information (skipped if not logged)
+    if LOG.isEnabledFor(logging.DEBUG):
+        date_time = datetime.datetime.now().astimezone()
+        date_time = date_time.strftime('%B %d, %Y, %I:%M %p (%Z)')
+        platinfo = ', '.join(platform.uname())
+        LOG.debug('logging started:  %s', date_time)
+        # pywemo does not provide version at this time (no pywemo.__version__)
+        LOG.debug('platform:  %s', platinfo)
+        LOG.debug('current directory:  %s', pathlib.Path.cwd())
+        if verbose > 2:
+            LOG.debug('logging to file:  %s', filename.resolve())
 
 
 # -----------------------------------------------------------------------------
-def find_wemo_aps() -> Tuple[List[str], str]:
-    """Use network manager cli to find wemo access points to connect to."""
+def scan_wifi_networks() -> str:
+    """Use network manager cli to rescan and list the wifi networks."""
+    # pylint: disable=import-outside-toplevel
+    from pywemo.ouimeaux_device import SetupException
+
     try:
-        subprocess.run(['nmcli', 'device', 'wifi', 'rescan'], check=False)
+        # rescan and list the networks with a single nmcli call
         networks = subprocess.run(
             [
                 'nmcli',
+                '--wait',
+                '3',
                 '--get-values',
                 'SSID,IN-USE,CHAN,SIGNAL,SECURITY',
                 'device',
                 'wifi',
+                'list',
+                '--rescan',
+                'yes',
             ],
             check=True,
             capture_output=True,
+            text=True,
         )
     except FileNotFoundError as exc:
         raise SetupException(
             'nmcli command failed (NetworkManager must be installed)'
         ) from exc
     except subprocess.CalledProcessError as exc:
-        try:
-            LOG.error('stdout:\n%s', networks.stdout.decode().strip())
-            LOG.error('stderr:\n%s', networks.stderr.decode().strip())
-        except UnboundLocalError:
-            pass
+        LOG.error('stdout:\n%s', exc.stdout.strip())
+        LOG.error('stderr:\n%s', exc.stderr.strip())
         raise SetupException('nmcli command failed') from exc
 
-    args = ' '.join(networks.args)
-    stdout = networks.stdout.decode().strip()
-    LOG.debug('result of "%s":\nstdout:\n%s', args, stdout)
+    stdout = networks.stdout.strip()
+    if LOG.isEnabledFor(logging.DEBUG):
+        args = ' '.join(networks.args)
+        LOG.debug('result of "%s":\nstdout:\n%s', args, stdout)
+
+    return stdout
+
+
+# -----------------------------------------------------------------------------
+def find_wemo_aps() -> Tuple[List[str], str]:
+    """Use network manager cli to find wemo access points to connect to."""
+    # the first scan may race with the rescan and return nothing, so retry
+    # once before giving up
+    for attempt in range(2):
+        stdout = scan_wifi_networks()
+        if stdout or attempt:
+            break
+        LOG.debug('no result from nmcli, retrying')
+        time.sleep(1.5)
 
     if not stdout:
         LOG.warning('no result from nmcli, try again')
 
     wemo_networks = []
     current_network = ''
-    for line in stdout.split('\n'):
+    for line in stdout.splitlines():
         if not line.strip():
             continue
-        ssid, in_use, channel, signal, security = line.rsplit(':', 4)
+        # the SSID may contain (escaped) colons, but the other fields will not
+        rest, _, security = line.rpartition(':')
+        rest, _, signal = rest.rpartition(':')
+        rest, _, channel = rest.rpartition(':')
+        ssid, _, in_use = rest.rpartition(':')
         if in_use == '*':
             LOG.debug(
                 'current network: %s (channel=%s, signal=%s, security=%s)',
@@ -161,8 +242,27 @@ def find_wemo_aps() -> Tuple[List[str], str]:
 
 
 # -----------------------------------------------------------------------------
-def log_details(device: Device, verbose: int = 0) -> None:
-    """Log some basic details about the device."""
+def requires_arguments(action: Action) -> bool:
+    """Return True if the UPnP action has any input arguments.
+
+    If the arguments can not be determined, the action is assumed to not
+    require any (so it is still called).
+    """
+    # pywemo lists only the input arguments of the action in args
+    return bool(getattr(action, 'args', None))
+
+
+# -----------------------------------------------------------------------------
+def call_action(device: Device, service_name: str, action_name: str) -> dict:
+    """Call a UPnP action (without arguments) on the device."""
+    return device.services[service_name].actions[action_name]()
+
+
+# -----------------------------------------------------------------------------
+def actions_to_call(
+    device: Device, verbose: int = 0
+) -> List[Tuple[str, str, str]]:
+    """Get the (service, action, result key) to call for the details."""
     # display some general information about the device that the
     # user may find useful in understanding it
     if verbose == 0:
@@ -191,50 +291,123 @@ def log_details(device: Device, verbose: int = 0) -> None:
         else:
             skip_actions = {}
         for service_name, service in device.services.items():
-            for action_name in service.actions.keys():
-                if action_name.lower() in skip_actions:
+            for action_name, action in service.actions.items():
+                lower_name = action_name.lower()
+                if lower_name in skip_actions:
+                    continue
+                if not lower_name.startswith('get'):
                     continue
-                if action_name.lower().startswith('get'):
-                    data_to_print.append((service_name, action_name, None))
+                if requires_arguments(action):
+                    # skip these, since calling them without the required
+                    # argument(s) would only return an error
+                    LOG.debug(
+                        'skipping %s.%s (requires arguments)',
+                        service_name,
+                        action_name,
+                    )
+                    continue
+                data_to_print.append((service_name, action_name, None))
+
+    return data_to_print
+
+
+# -----------------------------------------------------------------------------
+def format_details(device: Device, verbose: int = 0) -> List[Tuple[int, str]]:
+    """Format some basic details about the device.
+
+    Returns the (log level, line) pairs in the order they should be logged.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pywemo.exceptions import ActionException, SOAPFault
+
+    # each action is a blocking round trip to the device, so run them all
+    # concurrently and then log the results in the original order
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [
+            (
+                service_name,
+                action_name,
+                key,
+                executor.submit(
+                    call_action, device, service_name, action_name
+                ),
+            )
+            for service_name, action_name, key in actions_to_call(
+                device, verbose
+            )
+        ]
 
+    lines = []
     failed_calls = []
-    for service_name, action_name, key in data_to_print:
+    for service_name, action_name, key, future in futures:
         name = f'{service_name}.{action_name}'
         try:
-            result = device.services[service_name].actions[action_name]()
-
-            try:
-                failed = result['faultstring'].lower() == 'upnperror'
-                if failed:
-                    # print the failed ones at the end for easier visual
-                    # separation
-                    failed_calls.append((name, result))
-                    continue
-            except KeyError:
-                pass
-
-            # try to display the requested key, but display the entire result
-            # if it doesn't exist
-            try:
-                name = f'{service_name}.{action_name}[{key}]'
-                LOG.info('    %60s: %s', name, result[key])
-            except KeyError:
-                LOG.info('    %60s: %s', name, result)
-        except (AttributeError, KeyError, TypeError) as exc:
+            result = future.result()
+        except SOAPFault as exc:
+            # the device responded with an error (e.g. UPnPError), print the
+            # failed ones at the end for easier visual separation
+            failed_calls.append((name, exc))
+            continue
+        except (ActionException, AttributeError, KeyError, TypeError) as exc:
             # something went wrong, hard coded services may not be available on
-            # all platforms, or some Get methods may require an argument
-            LOG.warning(
-                '    %60s: %s', f'Failed to get result for s{name}', exc
-            )
+            # all platforms, or the device may not be responding
+            name = f'Failed to get result for {name}'
+            lines.append((logging.WARNING, f'    {name:>60s}: {exc}'))
+            continue
+
+        # display the requested key, but display the entire result if it
+        # doesn't exist
+        name = f'{service_name}.{action_name}[{key}]'
+        if key in result:
+            lines.append((logging.INFO, f'    {name:>60s}: {result[key]}'))
+        else:
+            lines.append((logging.INFO, f'    {name:>60s}: {result}'))
 
     if failed_calls:
-        LOG.warning(
-            '    The results below resulted in an error.  This may be due to '
-            'the action no longer working or that the method requires an '
-            'argument.'
+        lines.append(
+            (
+                logging.WARNING,
+                '    The results below resulted in an error.  This may be due '
+                'to the action no longer working or that the method requires '
+                'an argument.',
+            )
         )
     for name, result in failed_calls:
-        LOG.info('    %60s: %s', name, result)
+        lines.append((logging.INFO, f'    {name:>60s}: {result}'))
+
+    return lines
+
+
+# -----------------------------------------------------------------------------
+def wait_for_connection(wemossid: str, timeout: float = 5.0) -> None:
+    """Wait for nmcli to report that the Wemo AP connection is connected."""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            result = subprocess.run(
+                [
+                    'nmcli',
+                    '--get-values',
+                    'GENERAL.CONNECTION,GENERAL.STATE',
+                    'device',
+                    'show',
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            # unable to check, so fall back to a short fixed delay
+            time.sleep(2.0)
+            return
+        lines = result.stdout.splitlines()
+        for connection, state in zip(lines, lines[1:]):
+            if connection.startswith(wemossid) and state.startswith('100'):
+                return
+        time.sleep(delay)
+        delay = min(delay * 2, 0.4)
+    LOG.debug('%s not reported as connected after %ss', wemossid, timeout)
 
 
 # -----------------------------------------------------------------------------
@@ -242,33 +415,35 @@ def connect_to_wemo_and_setup(
     wemossid: str, ssid: str, password: str, timeout: float = 20.0
 ) -> None:
     """Connect to a Wemo devices AP and then set up the device."""
+    # pylint: disable=import-outside-toplevel
+    from pywemo.ouimeaux_device import SetupException
+
     try:
         networks = subprocess.run(
             ['nmcli', 'device', 'wifi', 'connect', wemossid],
             check=True,
             capture_output=True,
+            text=True,
         )
     except FileNotFoundError as exc:
         raise SetupException(
             'nmcli command failed (NetworkManager must be installed)'
         ) from exc
     except subprocess.CalledProcessError as exc:
-        try:
-            LOG.error('stdout:\n%s', networks.stdout.decode().strip())
-            LOG.error('stderr:\n%s', networks.stderr.decode().strip())
-        except UnboundLocalError:
-            pass
+        LOG.error('stdout:\n%s', exc.stdout.strip())
+        LOG.error('stderr:\n%s', exc.stderr.strip())
         raise SetupException(
             'nmcli command failed (network may not exist anymore or may no '
             'longer be reachable)'
         ) from exc
 
-    args = ' '.join(networks.args)
-    stdout = networks.stdout.decode().strip()
-    LOG.debug('result of "%s":\nstdout:\n%s', args, stdout)
+    if LOG.isEnabledFor(logging.DEBUG):
+        args = ' '.join(networks.args)
+        stdout = networks.stdout.strip()
+        LOG.debug('result of "%s":\nstdout:\n%s', args, stdout)
 
-    # short delay to make sure the connection is well established
-    time.sleep(2.0)
+    # make sure the connection is well established
+    wait_for_connection(wemossid)
 
     LOG.info('searching %s for wemo devices', wemossid)
     devices = discover_and_log_devices(only_needing_setup=True)
@@ -276,31 +451,154 @@ def connect_to_wemo_and_setup(
         device.setup(ssid=ssid, password=password, timeout=timeout)
 
 
+# -----------------------------------------------------------------------------
+def get_network_status(device: Device) -> str:
+    """Get the devices network status ('1' means it is already setup)."""
+    # pylint: disable=import-outside-toplevel
+    from pywemo.exceptions import ActionException
+
+    try:
+        return device.WiFiSetup.GetNetworkStatus()['NetworkStatus']
+    except (ActionException, AttributeError, KeyError, TypeError) as exc:
+        LOG.warning('failed to get network status of %s: %s', device, exc)
+        LOG.warning('|-- thus skipping: %s', device)
+        return ''
+
+
+# -----------------------------------------------------------------------------
+def save_device_cache(devices: List[Device]) -> None:
+    """Save the location of discovered devices for later runs.
+
+    The cache is only an optimization, so any failure is logged and ignored.
+    """
+    try:
+        cache = {
+            device.udn: {
+                'name': device.name,
+                'host': device.host,
+                'port': device.port,
+            }
+            for device in devices
+        }
+    except AttributeError as exc:
+        LOG.debug('unable to cache devices: %s', exc)
+        return
+
+    try:
+        DEVICE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEVICE_CACHE, 'w', encoding='utf-8') as fout:
+            json.dump(cache, fout, indent=2)
+    except OSError as exc:
+        LOG.debug('unable to write device cache %s: %s', DEVICE_CACHE, exc)
+
+
+# -----------------------------------------------------------------------------
+def find_cached_device(name: str) -> Optional[Device]:
+    """Probe the previously discovered device(s) with the given name.
+
+    Returns None if no such device is cached or it no longer responds.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pywemo
+    from pywemo.ouimeaux_device import probe_wemo
+
+    try:
+        with open(DEVICE_CACHE, 'r', encoding='utf-8') as fin:
+            cache = json.load(fin)
+    except (OSError, ValueError):
+        return None
+
+    target = name.lower()
+    try:
+        matches = [
+            (udn, info['host'], info['port'])
+            for udn, info in cache.items()
+            if info['name'].lower() == target
+        ]
+    except (AttributeError, KeyError, TypeError) as exc:
+        # the cache is only an optimization, ignore it if it is malformed
+        LOG.debug('ignoring invalid device cache %s: %s', DEVICE_CACHE, exc)
+        return None
+    if len(matches) > 1:
+        # don't pick an arbitrary one, let the full discovery sort it out
+        LOG.warning(
+            'found %s cached devices named "%s", skipping the cache',
+            len(matches),
+            name,
+        )
+        return None
+
+    for udn, host, port in matches:
+        LOG.debug('probing cached device %s at %s', udn, host)
+        port = probe_wemo(host, ports=(port,), probe_timeout=2)
+        if port is None:
+            continue
+        url = pywemo.setup_url_for_address(host, port)
+        # returns None if the description can not be fetched or parsed
+        device = pywemo.discovery.device_from_description(url)
+        if device is not None and device.name.lower() == target:
+            LOG.info('found cached device: %s', device)
+            return device
+    return None
+
+
 # -----------------------------------------------------------------------------
 def discover_and_log_devices(
-    only_needing_setup: bool = False, verbose: int = 0
+    only_needing_setup: bool = False,
+    verbose: int = 0,
+    only_name: Optional[str] = None,
 ) -> List[Device]:
-    """Discover and log details about devices."""
+    """Discover and log details about devices.
+
+    If only_name is provided, then only the first device with that (case
+    insensitive) name is returned, without logging details of any device.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pywemo
+
     devices = pywemo.discover_devices()
-    not_setup = []
-    device = None
-    for device in devices:
-        if only_needing_setup:
-            status = device.WiFiSetup.GetNetworkStatus()['NetworkStatus']
-            if status not in {'1'}:
+    if only_needing_setup:
+        # query the devices concurrently, since each is a round trip
+        with ThreadPoolExecutor(max_workers=min(32, len(devices) or 1)) as ex:
+            statuses = list(ex.map(get_network_status, devices))
+        not_setup = []
+        for device, status in zip(devices, statuses):
+            if status and status not in {'1'}:
                 not_setup.append(device)
                 LOG.info('found device needing setup: %s', device)
-        else:
-            LOG.info(DASHES)
-            LOG.info('found device: %s', device)
-            if verbose >= 0:
-                log_details(device, verbose)
-
-    if only_needing_setup:
         return not_setup
 
+    save_device_cache(devices)
+    if only_name is not None:
+        target = only_name.lower()
+        matches = [
+            device for device in devices if device.name.lower() == target
+        ]
+        if len(matches) > 1:
+            LOG.warning(
+                'found %s devices named "%s", using the first one',
+                len(matches),
+                only_name,
+            )
+        if matches:
+            LOG.info('found device: %s', matches[0])
+        return matches[:1]
+
+    device = None
+    for device in devices:
+        lines = [
+            (logging.INFO, dashes()),
+            (logging.INFO, f'found device: {device}'),
+        ]
+        if verbose >= 0:
+            lines.extend(format_details(device, verbose))
+        # log consecutive lines of the same level with a single call, rather
+        # than one call per line
+        for level, group in itertools.groupby(lines, key=itemgetter(0)):
+            LOG.log(level, '%s', '\n'.join(line for _, line in group))
+
     if device:
-        LOG.info(DASHES)
+        LOG.info(dashes())
     LOG.info('found %s devices', len(devices))
     return devices
 
@@ -385,27 +683,22 @@ def wemo_discover(verbose: int, info: int) -> List[Device]:
 def wemo_rename(verbose: int, path: str) -> None:
     """Mass rename devices from a CSV file."""
     setup_logger(verbose)
-    udn_to_name = {}
-    ip_to_name = {}
     with open(path, 'r', newline='') as fin:
         fin.readline()  # header
-        for row in csv.reader(fin):
-            if not row or len(row) < 3 or row[0].startswith('#'):
-                # skip blank lines, lines without at least 3 items, and lines
-                # that start with a # (ignoring whitespace)
-                continue
-            udn, ip, name = [i.strip() for i in row]
-            if not name:
-                # skip the row if no name is provided
-                continue
-            if udn:
-                udn_to_name[udn] = name
-            if ip:
-                ip_to_name[ip] = name
+        # skip blank lines, lines without at least 3 items, and lines that
+        # start with a # (ignoring whitespace)
+        rows = [
+            [cell.strip() for cell in row[:3]]
+            for row in csv.reader(fin)
+            if len(row) >= 3 and not row[0].startswith('#')
+        ]
+    # skip the row if no name is provided
+    udn_to_name = {udn: name for udn, _, name in rows if udn and name}
+    ip_to_name = {ip: name for _, ip, name in rows if ip and name}
 
     devices = discover_and_log_devices()
     for device in devices:
-        udn = device._config.get_UDN()  # pylint: disable=protected-access
+        udn = device.udn
         ip = device.host
         # set by ip first and then UDN second, so UDN has higher precedence
         name = ip_to_name.get(ip, '')
@@ -471,6 +764,9 @@ def click_wemo_reset(
     with!  To reset a device, you should be connected to whatever network the
     device is connected to.
     """
+    # pylint: disable=import-outside-toplevel
+    from pywemo.ouimeaux_device import ResetException
+
     setup_logger(verbose)
     if full:
         data = True
@@ -486,20 +782,28 @@ def click_wemo_reset(
                 f'Are you sure you want to reset all {len(devices)} devices '
                 'listed above?'
             ):
-                for device in devices:
-                    LOG.info(DASHES)
-                    try:
-                        device.reset(data=data, wifi=wifi)
-                    except ResetException as exc:
-                        LOG.error(exc)
-                        LOG.error('|-- thus skipping: %s', device)
-                LOG.info(DASHES)
+                # reset the devices concurrently, since each waits on the
+                # device to respond
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = {
+                        executor.submit(
+                            device.reset, data=data, wifi=wifi
+                        ): device
+                        for device in devices
+                    }
+                    for future in as_completed(futures):
+                        device = futures[future]
+                        try:
+                            future.result()
+                            LOG.info('reset requested for %s', device)
+                        except ResetException as exc:
+                            LOG.error('%s -- thus skipping: %s', exc, device)
+                LOG.info(dashes())
         elif name is not None:
-            selected = None
-            for device in discover_and_log_devices():
-                if device.name.lower() == name.lower():
-                    selected = device
-                    break
+            selected = find_cached_device(name)
+            if selected is None:
+                found = discover_and_log_devices(only_name=name)
+                selected = found[0] if found else None
             if selected is None:
                 raise ResetException(f'device named "{name}" not found')
             selected.reset(data=data, wifi=wifi)
@@ -568,14 +872,17 @@ def click_wemo_setup(
     recommended to disable the 5GHz signal while setting up the Wemo devices,
     and then re-enabling it upon completion.
     """
+    # pylint: disable=import-outside-toplevel
+    from pywemo.ouimeaux_device import SetupException
+
     setup_logger(verbose)
     try:
-        LOG.info(DASHES)
+        LOG.info(dashes())
         LOG.info(
             'NOTE: If some or all devices fail to connect, try '
             're-running the same command a second time!'
         )
-        LOG.info(DASHES)
+        LOG.info(dashes())
         if setup_all:
             wemo_aps, current = find_wemo_aps()
             if not wemo_aps:
@@ -589,17 +896,17 @@ def click_wemo_setup(
                 f'Are you sure you want to setup all {len(wemo_aps)} '
                 '"expected wemo" devices listed above?'
             ):
-                LOG.info(DASHES)
+                LOG.info(dashes())
                 if not password:
                     password = getpass()
                 for wemo_ap in wemo_aps:
-                    LOG.info(DASHES)
+                    LOG.info(dashes())
                     try:
                         connect_to_wemo_and_setup(wemo_ap, ssid, password)
                     except SetupException as exc:
                         LOG.error(exc)
                         LOG.error('|-- thus skipping: %s', wemo_ap)
-                LOG.info(DASHES)
+                LOG.info(dashes())
 
                 if current and not current.lower().startswith('wemo.'):
                     try:
@@ -614,11 +921,10 @@ def click_wemo_setup(
                         # auto-reconnect anyway
                         pass
         elif name is not None:
-            selected = None
-            for device in discover_and_log_devices():
-                if device.name.lower() == name.lower():
-                    selected = device
-                    break
+            selected = find_cached_device(name)
+            if selected is None:
+                found = discover_and_log_devices(only_name=name)
+                selected = found[0] if found else None
             if selected is None:
                 raise SetupException(f'device named "{name}" not found')
             selected.setup(ssid=ssid, password=password)